@@ -289,6 +289,75 @@ class RoboticWarehouse(gym.Env):
         """
         self.round_collisions = 0
         self.round_dropoffs = []
+        reward = self.__tick(actions)
+        """ Maybe there is some better choice for storing packages.. """
+        return (self.robots, list(self.packages.values())), reward, False, None
+
+    def step_n(self, actions: np.ndarray, n: int
+               ) -> (('robots', 'packages'), np.float64, bool, None):
+        """ 
+            Advance n ticks in one call.
+
+            Actions is either
+                [Robotic Action...]: held for all n ticks
+                [[Robotic Action...]...]: one row per tick (n rows)
+
+            Reward, collisions and dropoffs are summed over all ticks and
+            only the final observation is built.
+
+            With held actions, a tick that changes nothing (no robot moved, 
+            picked up or dropped anything) will keep changing nothing until 
+            the next package spawns, so those ticks are skipped by jumping 
+            the spawn timers straight to the next spawn event.
+        """
+        actions = np.asarray(actions)
+        if n < 1:
+            raise Exception("Cannot step {} ticks".format(n))
+
+        held = actions.ndim == 1
+        if not held and (actions.ndim != 2 or len(actions) != n):
+            raise Exception(
+                "Expected held actions or a schedule of {} ticks, got shape {}".
+                format(n, actions.shape))
+
+        reward = 0
+        collisions = 0
+        dropoffs = []
+        tick = 0
+        while tick < n:
+            self.round_collisions = 0
+            self.round_dropoffs = []
+            if held:
+                before = [(robot.position[0], robot.position[1],
+                           len(robot.packages)) for robot in self.robots]
+                tick_reward = self.__tick(actions)
+            else:
+                tick_reward = self.__tick(actions[tick])
+            tick += 1
+
+            reward += tick_reward
+            collisions += self.round_collisions
+            dropoffs.extend(self.round_dropoffs)
+
+            if held and tick_reward == 0 and before == [
+                (robot.position[0], robot.position[1], len(robot.packages))
+                    for robot in self.robots
+            ]:
+                """ Idle, nothing changes until the tick a package spawns. """
+                idle = min(n - tick, self.package_spawn_times[0][0] - 1)
+                if idle > 0:
+                    """ Subtracting all with idle will preserved heap structure. """
+                    for i in range(len(self.package_spawn_times)):
+                        self.package_spawn_times[i][0] -= idle
+                    self.steps += idle
+                    tick += idle
+
+        self.round_collisions = collisions
+        self.round_dropoffs = dropoffs
+        return (self.robots, list(self.packages.values())), reward, False, None
+
+    def __tick(self, actions: np.ndarray) -> int:
+        """ Advance a single tick, returns the reward of that tick. """
         """ Decrement all spawn-times. """
         for i in range(len(self.package_spawn_times)):
             """ Subtracting all with 1 will preserved heap structure. """
@@ -337,8 +406,7 @@ class RoboticWarehouse(gym.Env):
             reward += self.__actions[action](self.robots[r])
         """ Increment steps. """
         self.steps += 1
-        """ Maybe there is some better choice for storing packages.. """
-        return (self.robots, list(self.packages.values())), reward, False, None
+        return reward
 
     def __move_up(self, robot: list) -> int:
         return self.__move_direction(robot, RoboticWarehouse.UP)